@@ -51,6 +51,7 @@ class PaletteModelAdmin(admin.ModelAdmin):
     delete_selected_confirmation_template = "admin/delete_confirmation.html"
     delete_confirmation_template = "admin/delete_confirmation.html"
     list_per_page = 15
+    list_prefetch_related = ()
 
 
     def get_urls(self):
@@ -266,8 +267,6 @@ class PaletteModelAdmin(admin.ModelAdmin):
 
         # Handle POSTed bulk-edit data.
         if request.method == "POST" and cl.list_editable and "_save" in request.POST:
-            print("Add Form Submitted")
-
             if not self.has_change_permission(request):
                 raise PermissionDenied
             FormSet = self.get_changelist_formset(request)
@@ -369,7 +368,6 @@ class PaletteModelAdmin(admin.ModelAdmin):
             )
 
         if request.method == "POST" and "_saveasnew" in request.POST:
-            print("Saving as new")
             object_id = None
 
         add = object_id is None
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from django.conf import settings
 
 
@@ -22,11 +23,9 @@ BASE_MODEL_ICONS = {
 }
 
 
-global PALETTE_SETTINGS
-
 try:
-    PALETTE_SETTINGS:dict = settings.PALETTE_ADMIN_SETTINGS
-except Exception as e:
+    PALETTE_SETTINGS:dict = settings.PALETTE_ADMIN_SETTINGS or dict()
+except AttributeError:
     PALETTE_SETTINGS = dict()
 
 SETTINGS = {
@@ -44,6 +43,8 @@ SETTINGS = {
     ]
 }
 
+# User settings override the defaults above; icon maps extend the base icons.
+SETTINGS.update(PALETTE_SETTINGS)
 SETTINGS.update({
     'app_icons': {**BASE_APP_ICONS, **PALETTE_SETTINGS.get('app_icons', dict())},
     'model_icons': {**BASE_MODEL_ICONS, **PALETTE_SETTINGS.get('model_icons', dict())},
@@ -51,12 +52,14 @@ SETTINGS.update({
 
 
 
+# SETTINGS is fixed at import time, so icon lookups can be cached for the
+# life of the process.
+@lru_cache(maxsize=None)
 def get_base_app_icon(app_label):
-    _settings = SETTINGS
-    return SETTINGS['app_icons'][app_label]
+    return SETTINGS['app_icons'].get(app_label, '')
 
+@lru_cache(maxsize=None)
 def get_base_model_icon(model_name, app_label=None):
-    _settings = SETTINGS
     return SETTINGS['model_icons'].get(model_name, '')
 
 
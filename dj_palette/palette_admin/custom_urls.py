@@ -0,0 +1,11 @@
+from django.urls import path
+from .views import dashboard_view, dynamic_admin_page, edit_admin_page
+
+
+# Page editor routes; PaletteAdminSite includes these under pages/ when
+# show_editor is on, so the names live in the admin site's namespace.
+urlpatterns = [
+    path('', dashboard_view, name='custom-dashboard'),
+    path('edit/<slug:slug>/', edit_admin_page, name='edit-admin-page'),
+    path('<slug:slug>/', dynamic_admin_page, name='dynamic-admin-page'),
+]
@@ -1,10 +1,11 @@
 from django.contrib.admin import AdminSite
-from django.urls import path, re_path
-from .views import dashboard_view, dynamic_admin_page, edit_admin_page
+from django.urls import include, path, re_path
+from . import custom_urls as editor_urls
 from django.template.response import TemplateResponse
 from django.contrib.auth import logout, login
 from django.shortcuts import redirect
 from datetime import datetime
+from functools import lru_cache
 from django.apps import apps
 from django.http import Http404
 from django.utils.module_loading import import_string
@@ -16,22 +17,38 @@ from django.views.decorators.cache import never_cache
 from django.urls import NoReverseMatch, Resolver404, resolve, reverse, reverse_lazy
 from django.http import Http404, HttpResponsePermanentRedirect, HttpResponseRedirect
 from django.utils.decorators import method_decorator
-from django.conf import settings
+from django.utils.functional import cached_property
 from django.contrib.admin.models import LogEntry
+from django.contrib.admin.utils import quote
 from django.contrib.auth.views import (
+    LoginView,
     PasswordResetView,
     PasswordResetDoneView,
     PasswordResetConfirmView,
     PasswordResetCompleteView,
 )
 from .conf import (
-    SETTINGS,
+    SETTINGS as PALETTE_SETTINGS,
 )
 
 
+# Shared by every request; a tuple so templates can't mutate it.
+_CUSTOM_LINKS = tuple(PALETTE_SETTINGS.get('custom_links', ()))
 
-PALETTE_SETTINGS = getattr(settings, 'PALETTE_ADMIN_SETTINGS', SETTINGS)
 
+@lru_cache(maxsize=None)
+def _change_url_parts(site_name, app_label, model_name):
+    """
+    Reverse a model's change URL once with a sentinel pk and split it
+    around the pk, so object URLs can be built without calling reverse().
+    """
+    url = reverse(
+        f'{site_name}:{app_label}_{model_name}_change',
+        args=[0],
+        current_app=site_name
+    )
+    prefix, _sep, suffix = url.rpartition('/0/')
+    return f'{prefix}/', f'/{suffix}'
 
 
 
@@ -43,8 +60,27 @@ class PaletteAdminSite(AdminSite):
     index_title = PALETTE_SETTINGS.get('index_title', "Palette Admin")
     delete_selected_confirmation_template = "admin/delete_confirmation.html"
     delete_confirmation_template = "admin/delete_confirmation.html"
-    
-    
+
+
+    def __init__(self, name="admin"):
+        super().__init__(name)
+        # PALETTE_SETTINGS is fixed once settings are loaded, so the parts of
+        # each_context derived from it are prepared here rather than per request.
+        self._static_context = dict(PALETTE_SETTINGS)
+        self._available_apps_filter = frozenset(PALETTE_SETTINGS.get('available_apps') or ())
+
+        # The editor pages and the user's custom_urls only depend on settings,
+        # so their patterns are built once and reused by every get_urls().
+        extra_urls = []
+        if PALETTE_SETTINGS.get('show_editor', True):
+            extra_urls.append(path('pages/', include(editor_urls)))
+        extra_urls.extend([
+            path(url_path, self.admin_view(view_func), name)
+            for (url_path, view_func, name) in PALETTE_SETTINGS.get('custom_urls') or ()
+        ])
+        self._extra_urls = tuple(extra_urls)
+
+
     def register(self, model_or_iterable, admin_class=None, **options):
         from .admin import PaletteModelAdmin
         if admin_class is None:
@@ -67,21 +103,29 @@ class PaletteAdminSite(AdminSite):
             re_path(r'^(?P<app_label>\w+)/$', self.admin_view(self.app_index), name='app_list'),
         ] + super().get_urls()
 
-
-        if PALETTE_SETTINGS.get('show_editor', True):
-            custom_urls.extend([
-                path('pages/', dashboard_view, name='custom-dashboard'),
-                path('pages/edit/<slug:slug>/', edit_admin_page, name='edit-admin-page'),
-                path('pages/<slug:slug>/', dynamic_admin_page, name='dynamic-admin-page'),
-            ])
-        if PALETTE_SETTINGS.get('custom_urls'):
-            other_urls = PALETTE_SETTINGS.get('custom_urls', [])
-            custom_urls.extend([
-                path(url_path, self.admin_view(view_func), name) for (url_path, view_func, name)  in other_urls
-            ])
+        custom_urls.extend(self._extra_urls)
         return custom_urls
 
 
+    @cached_property
+    def index_path(self):
+        # The URLconf doesn't change once loaded, so reverse the index once.
+        return reverse(f"{self.name}:index", current_app=self.name)
+
+
+    @cached_property
+    def _resolved_login_form(self):
+        # Since this module gets imported in the application's root package,
+        # it cannot import models from other applications at the module level,
+        # and django.contrib.admin.forms eventually imports User.
+        from django.contrib.admin.forms import AdminAuthenticationForm
+        return self.login_form or AdminAuthenticationForm
+
+    @cached_property
+    def _resolved_login_template(self):
+        return self.login_template or "admin/login.html"
+
+
     def logout(self, request, **kwargs):
         logout(request)
         return redirect('palette_admin:login') # Redirect to the login page after logout
@@ -94,14 +138,7 @@ class PaletteAdminSite(AdminSite):
         """
         if request.method == "GET" and self.has_permission(request):
             # Already logged-in, redirect to admin index
-            index_path = reverse("palette_admin:index", current_app=self.name)
-            return HttpResponseRedirect(index_path)
-
-        # Since this module gets imported in the application's root package,
-        # it cannot import models from other applications at the module level,
-        # and django.contrib.admin.forms eventually imports User.
-        from django.contrib.admin.forms import AdminAuthenticationForm
-        from django.contrib.auth.views import LoginView
+            return HttpResponseRedirect(self.index_path)
 
         context = {
             **self.each_context(request),
@@ -114,46 +151,54 @@ class PaletteAdminSite(AdminSite):
             REDIRECT_FIELD_NAME not in request.GET
             and REDIRECT_FIELD_NAME not in request.POST
         ):
-            context[REDIRECT_FIELD_NAME] = reverse("palette_admin:index", current_app=self.name)
+            context[REDIRECT_FIELD_NAME] = self.index_path
         context.update(extra_context or {})
 
         defaults = {
             "extra_context": context,
             'next_page': 'palette_admin:index',
-            "authentication_form": self.login_form or AdminAuthenticationForm,
-            "template_name": self.login_template or "admin/login.html",
+            "authentication_form": self._resolved_login_form,
+            "template_name": self._resolved_login_template,
         }
         request.current_app = self.name
         return LoginView.as_view(**defaults)(request)
 
 
     def get_app_list(self, request):
+        # each_context, index and app_index all ask for the app list during
+        # one request; build it once and keep it on the request.
+        app_list = getattr(request, '_palette_app_list_cache', None)
+        if app_list is not None:
+            return app_list
+
         app_dict = self._build_app_dict(request)
 
-        # Inject model manager as model.objects for template use
+        # Inject model manager as model.objects for template use. Managers
+        # are lazy, so nothing is queried unless a template asks for it.
         for app_label, app in app_dict.items():
             for model_dict in app['models']:
-                model_class = self._registry[model_dict['model']].model
-                model_dict['objects'] = model_class._default_manager  # or .objects
+                model_dict['objects'] = model_dict['model']._default_manager
 
         app_list = sorted(app_dict.values(), key=lambda x: x['name'].lower())
         for app in app_list:
             app['models'].sort(key=lambda x: x['name'])
+
+        request._palette_app_list_cache = app_list
         return app_list
 
 
     def each_context(self, request):
         context = super().each_context(request)
-        context['custom_links'] = PALETTE_SETTINGS.get('custom_links', [])
+        context['custom_links'] = _CUSTOM_LINKS
 
-        for key, value in PALETTE_SETTINGS.items():
-            if key not in context:
-                context[key] = value
+        for key, value in self._static_context.items():
+            context.setdefault(key, value)
 
-        if PALETTE_SETTINGS.get('available_apps'):
-            context['available_apps'] =  [app for app in self.get_app_list(request) if app['app_label'] in PALETTE_SETTINGS.get('available_apps') ]
+        app_list = self.get_app_list(request)
+        if self._available_apps_filter:
+            context['available_apps'] = [app for app in app_list if app['app_label'] in self._available_apps_filter]
         else:
-            context['available_apps'] = self.get_app_list(request)
+            context['available_apps'] = app_list
         return context
     
 
@@ -161,34 +206,40 @@ class PaletteAdminSite(AdminSite):
     def index(self, request, extra_context:dict=None, **kwargs):
         context:dict = self.each_context(request)
         
-        now = datetime.now().time()
-        greeting = 'Morning'
-        if 12 < now.hour <= 16:greeting='Afternoon'
-        if now.hour > 16:greeting='Evening'
+        # 0-12 Morning, 13-16 Afternoon, 17-23 Evening
+        hour = datetime.now().hour
+        greeting = ('Morning', 'Afternoon', 'Evening')[(hour > 12) + (hour > 16)]
 
         # Get recent actions by the logged-in user (last 10)
         recent_actions = LogEntry.objects.filter(
             user=request.user
         ).select_related(
-            'user', 'content_type'
+            'content_type'
+        ).only(
+            'action_time', 'action_flag', 'object_id', 'object_repr',
+            'change_message', 'user_id',
+            'content_type__app_label', 'content_type__model',
         ).order_by('-action_time')[:7]
 
-        # Build admin URLs for each log entry
+        # Build admin URLs for each log entry, reversing once per content type
+        ct_url_parts = {}
         for log in recent_actions:
-            print("Got Action:", log)
-            if not log.is_deletion() and log.object_id:
+            log.admin_url = None
+            if log.is_deletion() or not log.object_id or log.content_type_id is None:
+                continue
+            if log.content_type_id not in ct_url_parts:
                 try:
-                    app_label = log.content_type.app_label
-                    model_name = log.content_type.model
-                    log.admin_url = reverse(
-                        f'{self.name}:{app_label}_{model_name}_change',
-                        args=[log.object_id],
-                        current_app=self.name
+                    ct_url_parts[log.content_type_id] = _change_url_parts(
+                        self.name,
+                        log.content_type.app_label,
+                        log.content_type.model,
                     )
-                except Exception as error:
-                    log.admin_url = None
-            else:
-                log.admin_url = None
+                except NoReverseMatch:
+                    ct_url_parts[log.content_type_id] = None
+            url_parts = ct_url_parts[log.content_type_id]
+            if url_parts is not None:
+                prefix, suffix = url_parts
+                log.admin_url = f'{prefix}{quote(log.object_id)}{suffix}'
 
         context.update({
             'greeting': greeting,
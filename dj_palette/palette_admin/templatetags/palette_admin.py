@@ -1,11 +1,11 @@
 from django import template
+from dj_palette.palette_admin.conf import get_base_app_icon, get_base_model_icon
 
 register = template.Library()
 
 
 @register.filter
 def app_icon_class(app, icon=''):
-    from dj_palette.palette_admin.conf import get_base_app_icon
     label = app['app_label']
     if label:
         return get_base_app_icon(label)
@@ -14,8 +14,6 @@ def app_icon_class(app, icon=''):
 
 @register.filter
 def model_icon_class(model, icon=''):
-    from dj_palette.palette_admin.conf import get_base_model_icon
-
     label:str = model['name'].lower()
     if label:
         return get_base_model_icon(label)
@@ -89,6 +89,16 @@ class PaletteChangList(ChangeList):
 		self.grid_display_links = grid_display_links
 		# self.grid_actions = grid_actions
 
+	def get_queryset(self, request, *args, **kwargs):
+		# Like list_select_related, but for many-to-many and reverse relations
+		# that list_display or grid_display columns walk for every row.
+		# Applied here rather than in apply_select_related(), which Django
+		# skips when the ModelAdmin's queryset already uses select_related().
+		qs = super().get_queryset(request, *args, **kwargs)
+		if self.model_admin.list_prefetch_related:
+			qs = qs.prefetch_related(*self.model_admin.list_prefetch_related)
+		return qs
+
 	
 
 	
@@ -1,27 +1,38 @@
+from functools import lru_cache
 from django import template
 from django.urls import reverse
 import re
 
 register = template.Library()
 
-@register.simple_tag(takes_context=True)
-def admin_back_url(context):
-    path = context['request'].path
-    # Matches /admin/app/model/add/
-    m = re.match(r'^/admin/([^/]+)/([^/]+)/add/$', path)
-    if m:
-        app, model = m.groups()
-        return f"/admin/{app}/{model}/"
-    # Matches /admin/app/model/pk/change/
-    m = re.match(r'^/admin/([^/]+)/([^/]+)/\d+/change/$', path)
-    if m:
-        app, model = m.groups()
-        return f"/admin/{app}/{model}/"
-    # Matches /admin/app/model/
-    m = re.match(r'^/admin/([^/]+)/([^/]+)/$', path)
+# /admin/app/model/, /admin/app/model/add/ and /admin/app/model/pk/change/;
+# the last group is only set for the add and change pages
+_RE_ADMIN_PAGE = re.compile(r'^/admin/([^/]+)/([^/]+)/(?:(add|\d+/change)/)?$')
+
+
+@lru_cache(maxsize=None)
+def _index_url(url_name):
+    # Reversed once per process; call _index_url.cache_clear() after
+    # swapping the URLconf.
+    return reverse(url_name)
+
+
+def admin_back_path(path, index_url_name='admin:index'):
+    """
+    Return the page one level up from an admin path: add/change pages go
+    back to the changelist, the changelist goes back to the app index, and
+    anything else goes to the index named by index_url_name.
+    """
+    m = _RE_ADMIN_PAGE.match(path)
     if m:
-        app = m.group(1)
+        app, model, action = m.groups()
+        if action:
+            return f"/admin/{app}/{model}/"
         return f"/admin/{app}/"
     # Default: admin index
-    return reverse('admin:index')
+    return _index_url(index_url_name)
+
 
+@register.simple_tag(takes_context=True)
+def admin_back_url(context):
+    return admin_back_path(context['request'].path)
@@ -10,23 +10,29 @@ A component-based template system for Django with support for:
 - Context-aware rendering with proper scoping
 """
 
+import logging
 import os
 import re
+from datetime import date, datetime
+from functools import lru_cache
 from django import template
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
 from django.template import (
     Node,
     NodeList,
     TemplateSyntaxError,
     loader,
-    Context as TempContext,
 )
 from django.template.base import Parser, Token, token_kwargs
 from django.utils.safestring import mark_safe
-from django.urls import reverse
 from django.template.loader import render_to_string
+from .admin_back import admin_back_path
 
 
 register = template.Library()
+logger = logging.getLogger(__name__)
 
 @register.filter('dir')
 def dir_filter(obj):
@@ -37,6 +43,13 @@ def dir_filter(obj):
 # AST WALKING HELPERS
 # ========================
 
+_CHILD_NODELIST_ATTRS = ("nodelist", "nodelist_true", "nodelist_false", "nodelist_loop")
+
+# Node class -> the subset of _CHILD_NODELIST_ATTRS that class actually has.
+# Node classes defined here set _palette_child_attrs instead of being probed.
+_NODE_CHILDREN_ATTRS_CACHE = {}
+
+
 def _iter_nodelist_recursive(nodelist):
     """
     Walk a NodeList recursively, yielding all nodes including children.
@@ -45,13 +58,95 @@ def _iter_nodelist_recursive(nodelist):
     - nodelist: standard child list
     - nodelist_true/nodelist_false: if/else branches
     - nodelist_loop: for loops
+    
+    Nodes come out depth-first in document order. The walk keeps an explicit
+    stack of iterators rather than nesting one generator per level.
     """
-    for node in nodelist:
-        yield node
-        for attr in ("nodelist", "nodelist_true", "nodelist_false", "nodelist_loop"):
-            child = getattr(node, attr, None)
-            if isinstance(child, NodeList):
-                yield from _iter_nodelist_recursive(child)
+    stack = [iter(nodelist)]
+    while stack:
+        for node in stack[-1]:
+            yield node
+            cls = type(node)
+            attrs = _NODE_CHILDREN_ATTRS_CACHE.get(cls)
+            if attrs is None:
+                # Palette's own nodes declare their child lists; anything
+                # else is probed once per class
+                attrs = getattr(cls, "_palette_child_attrs", None)
+                if attrs is None:
+                    attrs = tuple(
+                        attr for attr in _CHILD_NODELIST_ATTRS
+                        if hasattr(cls, attr) or attr in vars(node)
+                    )
+                _NODE_CHILDREN_ATTRS_CACHE[cls] = attrs
+            children = [
+                child for child in (getattr(node, attr, None) for attr in attrs)
+                if isinstance(child, NodeList)
+            ]
+            if children:
+                # Descend before moving on to the next sibling
+                stack.extend(iter(child) for child in reversed(children))
+                break
+        else:
+            stack.pop()
+
+
+def _iter_palette_components(root_nodelist):
+    """
+    Yield every PaletteComponentNode under a NodeList.
+    
+    Follows each node's child_nodelists as Django's own get_nodes_by_type()
+    does, and yields components in document order, using a stack of
+    iterators like _iter_nodelist_recursive.
+    """
+    stack = [iter(root_nodelist)]
+    while stack:
+        for node in stack[-1]:
+            if isinstance(node, PaletteComponentNode):
+                yield node
+            children = [
+                child for child in (getattr(node, attr, None) for attr in node.child_nodelists)
+                if child is not None
+            ]
+            if children:
+                # Descend before moving on to the next sibling
+                stack.extend(iter(child) for child in reversed(children))
+                break
+        else:
+            stack.pop()
+
+
+# ========================
+# TEMPLATE LOADING HELPERS
+# ========================
+
+def _template_component_index(template_obj):
+    """
+    Map component name -> nodelist for every palette_component in a template.
+    
+    The AST is walked once per compiled template and the result stored on
+    the template itself, so it is dropped together with the template when
+    it is reloaded (e.g. by a non-cached template loader).
+    
+    Components are normally defined at the top level of a file, so only the
+    top-level nodes are checked; other tags there (if, block, ...) are
+    searched, but a component's own body is not.
+    """
+    tpl = getattr(template_obj, "template", template_obj)
+    index = getattr(tpl, "_palette_components", None)
+    if index is None:
+        index = {}
+        for node in getattr(tpl, "nodelist", None) or ():
+            if isinstance(node, PaletteComponentNode):
+                # The first definition wins, as with the old linear scan
+                index.setdefault(node.component_name, node.nodelist)
+                continue
+            for attr in node.child_nodelists:
+                child = getattr(node, attr, None)
+                if child:
+                    for nested in _iter_palette_components(child):
+                        index.setdefault(nested.component_name, nested.nodelist)
+        tpl._palette_components = index
+    return index
 
 
 # ========================
@@ -71,6 +166,8 @@ class PaletteOverrideNode(Node):
     by palette_ui and applied when the component is rendered.
     """
 
+    _palette_child_attrs = ("nodelist",)
+
     def __init__(self, name, nodelist):
         self.name = name
         self.nodelist = nodelist
@@ -90,6 +187,11 @@ def do_palette_override(parser, token):
         )
     
     block_name = bits[1]
+    
+    # Handle quoted strings
+    if block_name[0] in ('"', "'") and block_name[-1] == block_name[0]:
+        block_name = block_name[1:-1]
+    
     nodelist = parser.parse(("endpalette_override",))
     parser.delete_first_token()
     
@@ -100,6 +202,18 @@ def do_palette_override(parser, token):
 # PALETTE_BLOCK NODE
 # ========================
 
+# Shared fallback for blocks rendered outside palette_ui; never mutated.
+_EMPTY_OVERRIDES = {}
+
+
+class _Block:
+    """Provides block.super access to the original rendered content."""
+    __slots__ = ("super",)
+
+    def __init__(self, sup):
+        self.super = sup
+
+
 class PaletteBlockNode(Node):
     """
     Represents a named slot (block) within a component.
@@ -112,12 +226,14 @@ class PaletteBlockNode(Node):
     Rendering behavior:
     1. Render the base content (self.nodelist)
     2. Check if an override exists in context.render_context["palette_overrides"]
-    3. If override exists, create an isolated context with block.super
+    3. If override exists, push a context layer with block.super
     4. Render override with access to all parent variables
     
     This matches Django's {% block %} / {{ block.super }} semantics.
     """
 
+    _palette_child_attrs = ("nodelist",)
+
     def __init__(self, block_name, nodelist):
         self.block_name = block_name
         self.nodelist = nodelist
@@ -128,26 +244,17 @@ class PaletteBlockNode(Node):
         original = self.nodelist.render(context)
         
         # Check for overrides (set by palette_ui before rendering component)
-        overrides = context.render_context.get("palette_overrides", {}) or {}
+        overrides = context.render_context.get("palette_overrides") or _EMPTY_OVERRIDES
+        override_nodelist = overrides.get(self.block_name)
         
-        if self.block_name not in overrides:
+        if override_nodelist is None:
             # No override; return base content
             return original
         
-        # Override exists; render it with block.super available
-        override_nodelist = overrides[self.block_name]
-        
-        class _Block:
-            """Provides block.super access to the original rendered content."""
-            def __init__(self, sup):
-                self.super = sup
-        
-        # Build isolated context preserving parent variables
-        base = context.flatten()
-        temp_ctx = TempContext(base)
-        temp_ctx["block"] = _Block(original)
-        
-        return override_nodelist.render(temp_ctx)
+        # Override exists; render it with block.super available.
+        # Push a layer with block.super; parent variables stay visible
+        with context.push(block=_Block(original)):
+            return override_nodelist.render(context)
 
 
 @register.tag("palette_block")
@@ -177,6 +284,29 @@ def palette_block(parser, token):
 # PALETTE_COMPONENT NODE
 # ========================
 
+def _get_render_registry(render_context):
+    """
+    Return this render's component registry and its basename index.
+    
+    The registry holds the components rendered directly during this render,
+    keyed by template file, then component name. The basename index maps a
+    file's basename to the registry keys with that basename.
+    """
+    registry = render_context.get("PALETTE_COMPONENTS")
+    if registry is None:
+        registry = render_context["PALETTE_COMPONENTS"] = {}
+        render_context["PALETTE_COMPONENTS_BY_BASENAME"] = {}
+    return registry, render_context["PALETTE_COMPONENTS_BY_BASENAME"]
+
+
+def _register_component(registry, by_basename, file_key, component_name, nodelist):
+    """Add a component nodelist to a render registry and its basename index."""
+    registry.setdefault(file_key, {})[component_name] = nodelist
+    keys = by_basename.setdefault(os.path.basename(file_key), [])
+    if file_key not in keys:
+        keys.append(file_key)
+
+
 class PaletteComponentNode(Node):
     """
     Represents a component definition.
@@ -187,13 +317,16 @@ class PaletteComponentNode(Node):
             {% palette_block card_body %}...{% endpalette_block %}
         {% endpalette_component %}
     
-    The component's nodelist is registered into context.render_context
-    during the first render pass for later lookup by palette_ui.
+    palette_ui finds the component through the component index of the
+    template it loads; rendering the node directly also registers it in
+    context.render_context for the rest of that render.
     
     When rendered directly (not via palette_ui), returns the default
     rendered output so component definition files can be previewed.
     """
 
+    _palette_child_attrs = ("nodelist",)
+
     def __init__(self, file_key, component_name, nodelist):
         """
         Args:
@@ -207,18 +340,17 @@ class PaletteComponentNode(Node):
 
     def render(self, context):
         """
-        1. Register component nodelist into PALETTE_COMPONENTS registry
+        1. Register the component in this render's PALETTE_COMPONENTS registry
         2. Render the default content (for preview)
         """
-        # Register into render_context for later lookup
-        registry = context.render_context.setdefault("PALETTE_COMPONENTS", {})
-        file_components = registry.setdefault(self.file_key, {})
-        file_components[self.component_name] = self.nodelist
-        
-        # print(f"[PALETTE_COMPONENT] Registered '{self.component_name}' in '{self.file_key}'")
+        registry, by_basename = _get_render_registry(context.render_context)
+        _register_component(
+            registry, by_basename, self.file_key, self.component_name, self.nodelist
+        )
         
         # Expose registry to templates for debugging
-        context["PALETTE_COMPONENTS"] = registry
+        if settings.DEBUG:
+            context["PALETTE_COMPONENTS"] = registry
         
         # Render default content
         return self.nodelist.render(context)
@@ -285,50 +417,63 @@ def _parse_quoted_value(val_str):
     - Only treat as tag if wrapped in {% %}
     - Otherwise treat as literal (even if unquoted)
     """
+    # Fast path: a plain quoted literal (the common case) needs no strip,
+    # closing-quote search or template syntax checks
+    if (
+        len(val_str) > 1
+        and val_str[0] in ('"', "'")
+        and val_str[-1] == val_str[0]
+        and "{" not in val_str
+    ):
+        return ("literal", val_str[1:-1])
+    
     val_str = val_str.strip()
     
     if not val_str:
         return ("literal", "")
     
+    # Dispatch on the first character before running any prefix scans
+    first = val_str[0]
+    
     # Case 1: Quoted string - extract the inner content
-    if val_str[0] in ('"', "'"):
-        quote_char = val_str[0]
+    if first == '"' or first == "'":
         # Find the matching closing quote
-        end_idx = val_str.rfind(quote_char)
+        end_idx = val_str.rfind(first)
         
         if end_idx > 0:  # Found closing quote
             inner = val_str[1:end_idx]
             
             # Check what's inside the quotes
-            # 1a: "{{ variable }}" -> template expression
-            if inner.startswith("{{") and inner.endswith("}}"):
-                expr_content = inner[2:-2].strip()
-                return ("template_expr", expr_content)
-            
-            # 1b: "{% template_tag %}" -> template tag
-            elif inner.startswith("{%") and inner.endswith("%}"):
-                return ("tag", inner)
+            if inner[:1] == "{":
+                # 1a: "{{ variable }}" -> template expression
+                if inner[1:2] == "{" and inner.endswith("}}"):
+                    expr_content = inner[2:-2].strip()
+                    return ("template_expr", expr_content)
+                
+                # 1b: "{% template_tag %}" -> template tag
+                if inner[1:2] == "%" and inner.endswith("%}"):
+                    return ("tag", inner)
             
             # 1c: Mixed content with {{ }}: "prefix {{ var }} suffix"
-            elif "{{" in inner and "}}" in inner:
+            if "{{" in inner and "}}" in inner:
                 return ("template_expr", inner)
             
             # 1d: Regular quoted literal (including strings with spaces)
-            else:
-                return ("literal", inner)
+            return ("literal", inner)
         else:
             # Mismatched quotes
             return ("literal", val_str)
     
     # Case 2: Unquoted value
-    # Check for template expression: {{ ... }}
-    if val_str.startswith("{{") and val_str.endswith("}}"):
-        expr_content = val_str[2:-2].strip()
-        return ("template_expr", expr_content)
-    
-    # Check for template tag: {% ... %}
-    if val_str.startswith("{%") and val_str.endswith("%}"):
-        return ("tag", val_str)
+    if first == "{":
+        # Check for template expression: {{ ... }}
+        if val_str[1:2] == "{" and val_str.endswith("}}"):
+            expr_content = val_str[2:-2].strip()
+            return ("template_expr", expr_content)
+        
+        # Check for template tag: {% ... %}
+        if val_str[1:2] == "%" and val_str.endswith("%}"):
+            return ("tag", val_str)
     
     # Check for mixed expression: "prefix {{ var }} suffix" without quotes
     if "{{" in val_str and "}}" in val_str:
@@ -340,8 +485,42 @@ def _parse_quoted_value(val_str):
     return ("expression", val_str)
 
 
+def _compile_filter_cached(parser, token):
+    """
+    parser.compile_filter() with a per-parser cache keyed by the token.
+    
+    FilterExpressions are not modified after parsing, so palette_ui tags in
+    the same template that repeat an expression can share one.
+    """
+    filter_cache = parser.__dict__.setdefault("_palette_filter_cache", {})
+    filter_expr = filter_cache.get(token)
+    if filter_expr is None:
+        filter_expr = filter_cache[token] = parser.compile_filter(token)
+    return filter_expr
+
+
+# Prop value types that can be part of a fragment cache key
+_CACHEABLE_PROP_TYPES = (str, int, float, bool, type(None))
+
+
+def _fragment_cache_key(tpl_name, comp_name, local_vars):
+    """
+    Build the cache key for a palette_ui render, or None if it can't be cached.
+    
+    Props holding anything other than plain values (model instances,
+    querysets, ...) make the render uncacheable.
+    """
+    items = sorted(local_vars.items())
+    for _name, value in items:
+        if not isinstance(value, _CACHEABLE_PROP_TYPES):
+            return None
+    return make_template_fragment_key("palette_ui", [tpl_name, comp_name, repr(items)])
+
+
 class PaletteUINode(Node):
 
+    _palette_child_attrs = ("nodelist",)
+
     def __init__(self, reserved, props, nodelist):
         """
         Args:
@@ -352,6 +531,37 @@ class PaletteUINode(Node):
         self.reserved = reserved
         self.props = props
         self.nodelist = nodelist
+        
+        # Whether file/component are literals is fixed by the tag's syntax
+        self._file_is_literal = isinstance(reserved.get("file"), str)
+        self._component_is_literal = isinstance(reserved.get("component"), str)
+        
+        # Split props by kind once, so render only resolves expressions.
+        # Each value is either:
+        # - ("literal", string_value) -> use as-is
+        # - ("expression", FilterExpression) -> resolve from context
+        # - ("tag", template_tag_str) -> would need special handling
+        self._literal_props = {}
+        self._expr_props = {}
+        for var_name, var_spec in props.items():
+            if isinstance(var_spec, tuple) and len(var_spec) == 2:
+                var_type, var_value = var_spec
+                if var_type in ("literal", "tag"):
+                    self._literal_props[var_name] = var_value
+                elif var_type == "expression":
+                    self._expr_props[var_name] = var_value
+                else:
+                    self._literal_props[var_name] = None
+            else:
+                # Fallback: assume it's a FilterExpression for backward compatibility
+                self._expr_props[var_name] = var_spec
+        
+        # Overrides are fixed once the tag is parsed; collect them here
+        # instead of walking the inner nodelist on every render
+        self._overrides = {}
+        for node in _iter_nodelist_recursive(nodelist):
+            if isinstance(node, PaletteOverrideNode):
+                self._overrides[node.name] = node.nodelist
 
     def _resolve_token(self, expr, context):
         """
@@ -366,56 +576,39 @@ class PaletteUINode(Node):
         except Exception:
             return None
 
-    def _find_component_in_registry(self, registry, tpl_name, comp_name):
+    def _find_component_in_registry(self, registry, by_basename, tpl_name, comp_name, template_obj):
         """
-        Attempt to locate a component in the registry using multiple fallback strategies.
+        Attempt to locate a component using multiple fallback strategies.
+        
+        In order:
+        1. the component index of template_obj, the template the loader
+           returned for tpl_name
+        2. tpl_name, then the loaded template's own name, in this render's
+           registry
+        3. a file with the same basename among this render's components
         
         Returns the component nodelist if found, None otherwise.
         """
-        # Strategy 1: Direct lookup
-        comp_nodelist = registry.get(tpl_name, {}).get(comp_name)
+        # Strategy 1: The loaded file's own definitions
+        comp_nodelist = _template_component_index(template_obj).get(comp_name)
         if comp_nodelist is not None:
             return comp_nodelist
         
-        # Strategy 2: Template object name match
-        try:
-            template_obj = loader.get_template(tpl_name)
-            tpl_obj_name = (
-                getattr(template_obj, "name", None) or
-                getattr(getattr(template_obj, "origin", None), "name", None)
-            )
-            if tpl_obj_name:
-                comp_nodelist = registry.get(tpl_obj_name, {}).get(comp_name)
-                if comp_nodelist is not None:
-                    return comp_nodelist
-        except Exception:
-            pass
+        # Strategy 2: Components rendered under this file name
+        tpl_obj_name = (
+            getattr(template_obj, "name", None) or
+            getattr(getattr(template_obj, "origin", None), "name", None)
+        )
+        for key in (tpl_name, tpl_obj_name):
+            comp_nodelist = registry.get(key, {}).get(comp_name)
+            if comp_nodelist is not None:
+                return comp_nodelist
         
-        # Strategy 3: Basename match
-        basename = os.path.basename(tpl_name)
-        for key in list(registry.keys()):
-            if os.path.basename(key) == basename:
-                comp_nodelist = registry.get(key, {}).get(comp_name)
-                if comp_nodelist is not None:
-                    return comp_nodelist
-        
-        # Strategy 4: Scan template AST for component definition
-        try:
-            template_obj = loader.get_template(tpl_name)
-            root_nodelist = (
-                getattr(template_obj, "nodelist", None) or
-                (hasattr(template_obj, "template") and
-                 getattr(template_obj.template, "nodelist", None))
-            )
-            if root_nodelist:
-                for node in _iter_nodelist_recursive(root_nodelist):
-                    if (isinstance(node, PaletteComponentNode) and
-                        node.component_name == comp_name):
-                        # Register for future lookups
-                        registry.setdefault(tpl_name, {})[comp_name] = node.nodelist
-                        return node.nodelist
-        except Exception:
-            pass
+        # Strategy 3: Basename match among the components seen in this render
+        for key in by_basename.get(os.path.basename(tpl_name), ()):
+            comp_nodelist = registry.get(key, {}).get(comp_name)
+            if comp_nodelist is not None:
+                return comp_nodelist
         
         return None
 
@@ -425,9 +618,9 @@ class PaletteUINode(Node):
         
         Process:
         1. Resolve file path and component name from expressions/literals
-        2. Load template and trigger component registration if needed
+        2. Load template and find the component in it
         3. Resolve all context variables passed via 'with' clause
-        4. Collect overrides from inner palette_override nodes
+        4. Use the overrides collected from inner palette_override nodes
         5. Push context layer with component props
         6. Set overrides in render_context
         7. Render component nodelist
@@ -438,79 +631,83 @@ class PaletteUINode(Node):
         comp_expr = self.reserved.get("component")
         
         if file_expr is None or comp_expr is None:
-            print("[PALETTE_UI] ERROR: Missing file or component expression")
+            logger.error("[PALETTE_UI] Missing file or component expression")
             return ""
         
         # Resolve file path: can be string literal or FilterExpression ({{ var }})
-        tpl_name = self._resolve_token(file_expr, context)
-        if isinstance(file_expr, str):  # literal string
+        if self._file_is_literal:
             tpl_name = file_expr
+        else:
+            tpl_name = self._resolve_token(file_expr, context)
         
         # Resolve component name: can be string literal or FilterExpression ({{ var }})
-        if isinstance(comp_expr, str):  # literal string
+        if self._component_is_literal:
             comp_name = comp_expr
         else:
             comp_name = self._resolve_token(comp_expr, context)
         
         if not tpl_name or not comp_name:
-            print(f"[PALETTE_UI] ERROR: Invalid file='{tpl_name}' or component='{comp_name}'")
+            logger.error("[PALETTE_UI] Invalid file='%s' or component='%s'", tpl_name, comp_name)
             return f"<!-- palette_ui: file='{tpl_name}' component='{comp_name}' -->"
         
-        # Get or create component registry
-        registry = context.render_context.setdefault("PALETTE_COMPONENTS", {})
-        
-        # Ensure template is loaded, which will trigger component registration
-        try:
-            template_obj = loader.get_template(tpl_name)
-        except Exception as e:
-            print(f"[PALETTE_UI] ERROR: Could not load template '{tpl_name}': {e}")
-            return f"<!-- palette_ui: template '{tpl_name}' not found -->"
+        # Get or create this render's component registry
+        registry, by_basename = _get_render_registry(context.render_context)
         
-        # Locate component nodelist in registry
-        comp_nodelist = self._find_component_in_registry(registry, tpl_name, comp_name)
+        # Components already located during this render skip the lookup
+        resolve_cache = context.render_context.setdefault("PALETTE_COMPONENT_RESOLVE", {})
+        comp_nodelist = resolve_cache.get((tpl_name, comp_name))
         
         if comp_nodelist is None:
-            print(f"[PALETTE_UI] ERROR: Component '{comp_name}' not found in '{tpl_name}'")
-            return f"<!-- palette_ui: component '{comp_name}' not found -->"
+            # Go through the loader so file= resolves the way {% include %}
+            # would; the cached loader makes repeat loads cheap
+            try:
+                template_obj = loader.get_template(tpl_name)
+            except Exception as e:
+                logger.error("[PALETTE_UI] Could not load template '%s': %s", tpl_name, e)
+                return f"<!-- palette_ui: template '{tpl_name}' not found -->"
+            
+            # Locate component nodelist in registry
+            comp_nodelist = self._find_component_in_registry(
+                registry, by_basename, tpl_name, comp_name, template_obj
+            )
+            
+            if comp_nodelist is None:
+                logger.error("[PALETTE_UI] Component '%s' not found in '%s'", comp_name, tpl_name)
+                return f"<!-- palette_ui: component '{comp_name}' not found -->"
+            
+            resolve_cache[(tpl_name, comp_name)] = comp_nodelist
         
-        # Resolve context variables from 'with' clause
-        # Each value is either:
-        # - ("literal", string_value) -> use as-is
-        # - ("expression", FilterExpression) -> resolve from context
-        # - ("tag", template_tag_str) -> would need special handling
-        local_vars = {}
-        for var_name, var_spec in self.props.items():
+        # Resolve context variables from 'with' clause: literals were
+        # settled at parse time, only expressions need the context
+        local_vars = dict(self._literal_props)
+        for var_name, expr in self._expr_props.items():
             try:
-                if isinstance(var_spec, tuple) and len(var_spec) == 2:
-                    var_type, var_value = var_spec
-                    if var_type == "literal":
-                        local_vars[var_name] = var_value
-                    elif var_type == "expression":
-                        resolved_value = var_value.resolve(context)
-                        local_vars[var_name] = resolved_value
-                    elif var_type == "tag":
-                        local_vars[var_name] = var_value
-                    else:
-                        local_vars[var_name] = None
-                else:
-                    # Fallback: assume it's a FilterExpression for backward compatibility
-                    resolved_value = var_spec.resolve(context)
-                    local_vars[var_name] = resolved_value
+                local_vars[var_name] = expr.resolve(context)
             except Exception as e:
-                print(f"[PALETTE_UI] WARNING: Could not resolve {var_name}: {e}")
+                logger.warning("[PALETTE_UI] Could not resolve %s: %s", var_name, e)
                 local_vars[var_name] = None
         
-        # Collect overrides from inner palette_override nodes
-        overrides = {}
-        for node in _iter_nodelist_recursive(self.nodelist):
-            if isinstance(node, PaletteOverrideNode):
-                # Strip quotes from override block name if needed
-                block_name = node.name
-                if block_name and block_name[0] in ('"', "'") and block_name[-1] == block_name[0]:
-                    block_name = block_name[1:-1]
-                overrides[block_name] = node.nodelist
+        # Overrides from inner palette_override nodes, collected at parse time
+        overrides = self._overrides
         
-        print(f"[PALETTE_UI] Rendering component='{comp_name}' from file='{tpl_name}'")
+        # Fragment cache, only when the tag opts in with cache=<seconds>;
+        # overrides are rendered from the page, so they are never cached
+        cache_timeout = self.reserved.get("cache")
+        cache_key = None
+        if cache_timeout is not None and not isinstance(cache_timeout, int):
+            try:
+                cache_timeout = int(self._resolve_token(cache_timeout, context))
+            except (TypeError, ValueError):
+                logger.warning("[PALETTE_UI] Invalid cache timeout for component '%s'", comp_name)
+                cache_timeout = None
+        if cache_timeout is not None and not overrides:
+            cache_key = _fragment_cache_key(tpl_name, comp_name, local_vars)
+            if cache_key is not None:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return mark_safe(cached)
+        
+        logger.debug("[PALETTE_UI] Rendering component='%s' from file='%s'", comp_name, tpl_name)
         
         # Save previous state (for nested palette_ui calls)
         prev_overrides = context.render_context.get("palette_overrides", None)
@@ -520,28 +717,24 @@ class PaletteUINode(Node):
         context.render_context["palette_overrides"] = overrides
         context.render_context["palette_current_component"] = comp_name
         
-        # Push a new context layer for component props (matches Django's {% include %} tag)
-        context.push()
+        local_vars["component_name"] = comp_name
+        # Expose registry for debugging
+        if settings.DEBUG:
+            local_vars["PALETTE_COMPONENTS"] = registry
+        
         try:
-            # Inject component props into the new context layer
-            for var_name, var_value in local_vars.items():
-                context[var_name] = var_value
-            
-            # Expose registry for debugging
-            context["PALETTE_COMPONENTS"] = registry
-            context["component_name"] = comp_name
-            
-            # Render the component nodelist with new context and overrides
-            rendered = comp_nodelist.render(context)
+            # Push a new context layer for component props (matches Django's {% include %} tag)
+            with context.push(**local_vars):
+                # Render the component nodelist with new context and overrides
+                rendered = comp_nodelist.render(context)
             
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("[PALETTE_UI] Error rendering component '%s'", comp_name)
             rendered = f"<!-- palette_ui render error: {e} -->"
+        else:
+            if cache_key is not None:
+                cache.set(cache_key, rendered, cache_timeout)
         finally:
-            # Pop the context layer
-            context.pop()
-            
             # Restore previous state
             context.render_context["palette_overrides"] = prev_overrides
             context.render_context["palette_current_component"] = prev_components
@@ -564,6 +757,8 @@ def do_palette_ui(parser, token):
     Supports:
     - file="..." or file=variable_name for template path
     - component="..." or component=variable_name for component name
+    - cache=seconds (optional) to cache the rendered output; see the docs
+      for which renders are cached
     - with key1=value1 key2=value2 ... for context variables
       - value can be: "literal_string", "{{ variable }}", "{% url ... %}", variable_name
     - Inner palette_override blocks for slot overrides
@@ -580,6 +775,7 @@ def do_palette_ui(parser, token):
     # Parse keyword arguments
     file_expr = None
     comp_expr = None
+    cache_expr = None
     with_vars = {}
     
     i = 1
@@ -609,23 +805,34 @@ def do_palette_ui(parser, token):
                 file_expr = val_content
             elif val_type == "template_expr":
                 # Template expression: compile as filter
-                file_expr = parser.compile_filter(val_content)
+                file_expr = _compile_filter_cached(parser, val_content)
             elif val_type == "tag":
                 # Template tag - compile
-                file_expr = parser.compile_filter(val_content)
+                file_expr = _compile_filter_cached(parser, val_content)
             else:  # "expression"
                 # Bare variable
-                file_expr = parser.compile_filter(val_content)
+                file_expr = _compile_filter_cached(parser, val_content)
+        
+        elif key == "cache":
+            if val_type == "literal":
+                try:
+                    cache_expr = int(val_content)
+                except ValueError:
+                    raise TemplateSyntaxError(
+                        f"{tag_name}: cache= takes a number of seconds, got '{val_content}'"
+                    )
+            else:
+                cache_expr = _compile_filter_cached(parser, val_content)
         
         elif key == "component":
             if val_type == "literal":
                 comp_expr = val_content
             elif val_type == "template_expr":
-                comp_expr = parser.compile_filter(val_content)
+                comp_expr = _compile_filter_cached(parser, val_content)
             elif val_type == "tag":
-                comp_expr = parser.compile_filter(val_content)
+                comp_expr = _compile_filter_cached(parser, val_content)
             else:  # "expression"
-                comp_expr = parser.compile_filter(val_content)
+                comp_expr = _compile_filter_cached(parser, val_content)
         
         else:
             # Treat as a 'with' variable before 'with' keyword is seen
@@ -634,13 +841,13 @@ def do_palette_ui(parser, token):
                 with_vars[key] = ("literal", val_content)
             elif val_type == "template_expr":
                 # Template expression - compile as filter
-                with_vars[key] = ("expression", parser.compile_filter(val_content))
+                with_vars[key] = ("expression", _compile_filter_cached(parser, val_content))
             elif val_type == "tag":
                 # Template tag - we'll handle this specially
                 with_vars[key] = ("tag", val_content)
             else:  # "expression"
                 # Bare variable reference - compile as filter
-                with_vars[key] = ("expression", parser.compile_filter(val_content))
+                with_vars[key] = ("expression", _compile_filter_cached(parser, val_content))
         
         i += 1
     
@@ -658,11 +865,11 @@ def do_palette_ui(parser, token):
         if val_type == "literal":
             with_vars[key] = ("literal", val_content)
         elif val_type == "template_expr":
-            with_vars[key] = ("expression", parser.compile_filter(val_content))
+            with_vars[key] = ("expression", _compile_filter_cached(parser, val_content))
         elif val_type == "tag":
             with_vars[key] = ("tag", val_content)
         else:  # "expression"
-            with_vars[key] = ("expression", parser.compile_filter(val_content))
+            with_vars[key] = ("expression", _compile_filter_cached(parser, val_content))
         i += 1
     
     # Validate required arguments
@@ -675,10 +882,11 @@ def do_palette_ui(parser, token):
     inner_nodelist = parser.parse(("endpalette_ui",))
     parser.delete_first_token()
     
-    # Store reserved keywords (file, component) separately from props
+    # Store reserved keywords (file, component, cache) separately from props
     reserved = {
         "file": file_expr,
         "component": comp_expr,
+        "cache": cache_expr,
     }
     
     # print(f"[PALETTE_UI PARSER] Parsed tag with file={file_expr!r}, component={comp_expr!r}")
@@ -694,41 +902,34 @@ def do_palette_ui(parser, token):
 
 @register.simple_tag(takes_context=True, name="back_button")
 def back_button(context):
-    path = context['request'].path
-    # Matches /admin/app/model/add/
-    m = re.match(r'^/admin/([^/]+)/([^/]+)/add/$', path)
-    if m:
-        app, model = m.groups()
-        return f"/admin/{app}/{model}/"
-    # Matches /admin/app/model/pk/change/
-    m = re.match(r'^/admin/([^/]+)/([^/]+)/\d+/change/$', path)
-    if m:
-        app, model = m.groups()
-        return f"/admin/{app}/{model}/"
-    # Matches /admin/app/model/
-    m = re.match(r'^/admin/([^/]+)/([^/]+)/$', path)
-    if m:
-        app = m.group(1)
-        return f"/admin/{app}/"
-    # Default: admin index
-    return reverse('palette_admin:index')
+    return admin_back_path(context['request'].path, 'palette_admin:index')
+
+
+@lru_cache(maxsize=512)
+def _parse_props(props_str):
+    # "key: value; key: value" -> (("key", "value"), ...); items without a
+    # colon are skipped. Returns a tuple so the result can be cached.
+    return tuple(
+        (key.strip(), val.strip())
+        for item in props_str.split(";") if ":" in item
+        for key, _sep, val in [item.partition(":")]
+    )
 
 
 @register.filter(name='render_ui')
 def render_ui(component_name, props_str=""):
-    props_dict = {}
-    try:
-        for item in props_str.split(";"):
-            if item.strip():
-                key, val = item.split(":", 1)
-                props_dict[key.strip()] = val.strip()
-    except Exception as e:
-        props_dict["error"] = str(e)
+    if isinstance(props_str, str):
+        props_dict = dict(_parse_props(props_str))
+    else:
+        # None, or a value such as a JSONField dict that can't be parsed
+        # (or used as a cache key); render the component without props
+        if props_str is not None:
+            logger.warning("[RENDER_UI] Ignoring non-string props for '%s': %r", component_name, props_str)
+        props_dict = {}
     return render_to_string(f"palette/components/{component_name}.html", {"props": props_dict})
 
 @register.filter
 def widget_type(field):
-    print("Widget for field:", field.field.widget_type)
     return field.field.widget_type
 
 
@@ -740,6 +941,10 @@ def is_multiple_select(field):
     return False
 
 
+# Model class -> [(field name, verbose name)] displayed by admin_fields
+_ADMIN_FIELDS_CACHE = {}
+
+
 @register.filter(name='admin_fields')
 def admin_fields(obj):
     """
@@ -751,30 +956,29 @@ def admin_fields(obj):
             <span>{{ field_name }}: {{ field_value }}</span>
         {% endfor %}
     """
-    from django.contrib.admin.utils import label_for_field
-    from django.db import models
-    
     if not obj:
         return []
     
-    result = []
     model = obj.__class__
+    fields = _ADMIN_FIELDS_CACHE.get(model)
+    if fields is None:
+        # Skip many-to-many and reverse relations; reverse one-to-one
+        # relations have no verbose_name and are skipped as well
+        fields = [
+            (field.name, field.verbose_name)
+            for field in model._meta.get_fields()
+            if not (field.many_to_many or field.one_to_many)
+            and hasattr(field, "verbose_name")
+        ]
+        _ADMIN_FIELDS_CACHE[model] = fields
     
-    # Get all fields from the model
-    for field in model._meta.get_fields():
-        # Skip many-to-many and reverse relations
-        if field.many_to_one or field.one_to_one:
-            try:
-                value = getattr(obj, field.name, None)
-                result.append((field.verbose_name.title(), value))
-            except Exception:
-                pass
-        elif not (field.many_to_many or field.one_to_many):
-            try:
-                value = getattr(obj, field.name, None)
-                result.append((field.verbose_name.title(), value))
-            except Exception:
-                pass
+    result = []
+    for name, verbose_name in fields:
+        try:
+            value = getattr(obj, name, None)
+            result.append((verbose_name.title(), value))
+        except Exception:
+            pass
     
     return result
 
@@ -793,6 +997,9 @@ def admin_field(obj, field_name):
         return None
 
 
+_PLAIN_SNAKE_CASE_RE = re.compile(r'[A-Za-z]+(?:_[A-Za-z]+)*')
+
+
 @register.filter(name='humanize_name')
 def humanize_name(value):
     """
@@ -804,7 +1011,17 @@ def humanize_name(value):
     """
     if not value:
         return value
-    return ' '.join(word.capitalize() for word in str(value).replace('_', ' ').split())
+    value = str(value)
+    if _PLAIN_SNAKE_CASE_RE.fullmatch(value):
+        # Letters joined by single underscores: title() gives the same result
+        # as capitalizing each word, in one pass
+        return value.replace('_', ' ').title()
+    return ' '.join(word.capitalize() for word in value.replace('_', ' ').split())
+
+
+_NULL_ICON = mark_safe('<span class="text-muted">—</span>')
+_TRUE_ICON = mark_safe('<i class="bi bi-check-circle-fill" style="color: #28a745; font-size: 1.2em;"></i>')
+_FALSE_ICON = mark_safe('<i class="bi bi-x-circle-fill" style="color: #dc3545; font-size: 1.2em;"></i>')
 
 
 @register.filter(name='format_field_value')
@@ -816,19 +1033,16 @@ def format_field_value(value, field_name=''):
     Example:
         {{ item|getattr:"is_active"|format_field_value }}
     """
-    from django.utils.html import format_html
-    from datetime import date, datetime
-    
     # Handle None/null values
     if value is None or value == '':
-        return mark_safe('<span class="text-muted">—</span>')
+        return _NULL_ICON
     
     # Handle boolean values
     if isinstance(value, bool):
         if value:
-            return mark_safe('<i class="bi bi-check-circle-fill" style="color: #28a745; font-size: 1.2em;"></i>')
+            return _TRUE_ICON
         else:
-            return mark_safe('<i class="bi bi-x-circle-fill" style="color: #dc3545; font-size: 1.2em;"></i>')
+            return _FALSE_ICON
     
     # Handle datetime objects
     if isinstance(value, datetime):
@@ -1,3 +1,188 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.template import Template, Context, TemplateSyntaxError, engines
+from django.template.loader import get_template
+from django.test import SimpleTestCase, override_settings
 
-# Create your tests here.
+
+COMPONENT_TEMPLATES = {
+    "mine/cards.html": (
+        '{% load palette %}'
+        '{% palette_component "card" %}MINE{% endpalette_component %}'
+    ),
+    "other/cards.html": (
+        '{% load palette %}'
+        '{% palette_component "card" %}OTHER{% endpalette_component %}'
+        '{% palette_component "extra" %}EXTRA{% endpalette_component %}'
+    ),
+    "page/cards.html": (
+        '{% load palette %}'
+        '{% palette_component "extra" %}PAGE{% endpalette_component %}|'
+        '{% palette_ui file="mine/cards.html" component="extra" %}{% endpalette_ui %}'
+    ),
+    "nested/cards.html": (
+        '{% load palette %}'
+        '{% if True %}'
+        '{% if True %}{% palette_component "a" %}FIRST{% endpalette_component %}{% endif %}'
+        '{% palette_component "a" %}SECOND{% endpalette_component %}'
+        '{% endif %}'
+    ),
+    "palette/components/props.html": (
+        '{% for key, value in props.items %}{{ key }}={{ value }};{% endfor %}'
+    ),
+    "cache/card.html": (
+        '{% load palette %}'
+        '{% palette_component "card" %}'
+        '[{% palette_block body %}{{ title }}{% endpalette_block %}|{{ who }}]'
+        '{% endpalette_component %}'
+    ),
+}
+
+PALETTE_TEMPLATES = [{
+    "BACKEND": "django.template.backends.django.DjangoTemplates",
+    "OPTIONS": {
+        "loaders": [
+            ("django.template.loaders.cached.Loader", [
+                ("django.template.loaders.locmem.Loader", COMPONENT_TEMPLATES),
+            ]),
+        ],
+    },
+}]
+
+
+def render_string(source, **context):
+    return Template("{% load palette %}" + source).render(Context(context))
+
+
+@override_settings(TEMPLATES=PALETTE_TEMPLATES)
+class RenderUITests(SimpleTestCase):
+
+    def test_props_string_is_parsed(self):
+        self.assertEqual(
+            render_string('{{ "props"|render_ui:"a: 1; b:x:y; junk" }}'),
+            "a=1;b=x:y;",
+        )
+
+    def test_non_string_props_render_without_props(self):
+        source = '{{ "props"|render_ui:props }}'
+        self.assertEqual(render_string(source, props=None), "")
+        self.assertEqual(render_string(source, props={"a": 1}), "")
+
+
+# A project template overriding an app template of the same name, and
+# extending it
+OVERRIDE_TEMPLATES = [{
+    "BACKEND": "django.template.backends.django.DjangoTemplates",
+    "OPTIONS": {
+        "loaders": [
+            ("django.template.loaders.cached.Loader", [
+                ("django.template.loaders.locmem.Loader", {"c.html": (
+                    '{% extends "c.html" %}{% load palette %}'
+                    '{% block body %}'
+                    '{% palette_component "card" %}PROJECT{% endpalette_component %}'
+                    '{% endblock %}'
+                )}),
+                ("django.template.loaders.locmem.Loader", {"c.html": (
+                    '{% load palette %}'
+                    '{% block body %}'
+                    '{% palette_component "card" %}APP{% endpalette_component %}'
+                    '{% endblock %}'
+                )}),
+            ]),
+        ],
+    },
+}]
+
+
+@override_settings(TEMPLATES=PALETTE_TEMPLATES)
+class ComponentLookupTests(SimpleTestCase):
+
+    def setUp(self):
+        # Start each test from unparsed templates
+        engines["django"].engine.template_loaders[0].reset()
+
+    def test_file_resolves_to_its_own_component(self):
+        get_template("other/cards.html")
+        output = render_string(
+            '{% palette_ui file="mine/cards.html" component="card" %}{% endpalette_ui %}'
+        )
+        self.assertEqual(output, "MINE")
+
+    def test_basename_fallback_only_sees_this_render(self):
+        # Parsed earlier by the same process, but not rendered here
+        get_template("other/cards.html")
+        output = render_string(
+            '{% palette_ui file="mine/cards.html" component="extra" %}{% endpalette_ui %}'
+        )
+        self.assertIn("component 'extra' not found", output)
+
+        # Rendered earlier in the same render, so the basename match applies
+        output = get_template("page/cards.html").render()
+        self.assertEqual(output, "PAGE|PAGE")
+
+    def test_first_definition_in_document_order_wins(self):
+        output = render_string(
+            '{% palette_ui file="nested/cards.html" component="a" %}{% endpalette_ui %}'
+        )
+        self.assertEqual(output, "FIRST")
+
+    @override_settings(TEMPLATES=OVERRIDE_TEMPLATES)
+    def test_file_follows_the_loader_for_overridden_templates(self):
+        source = '{% palette_ui file="c.html" component="card" %}{% endpalette_ui %}'
+        self.assertEqual(render_string(source), "PROJECT")
+        # Rendering c.html parses the app's copy through {% extends %}
+        self.assertEqual(get_template("c.html").render().strip(), "PROJECT")
+        self.assertEqual(render_string(source), "PROJECT")
+
+
+@override_settings(
+    TEMPLATES=PALETTE_TEMPLATES,
+    CACHES={"default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "dj-palette-tests",
+    }},
+)
+class FragmentCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cache_argument_reuses_the_render(self):
+        source = (
+            '{% palette_ui file="cache/card.html" component="card" cache=60 with title="T" %}'
+            '{% endpalette_ui %}'
+        )
+        self.assertEqual(render_string(source, who="alice"), "[T|alice]")
+        # Same file, component and props: served from the cache
+        self.assertEqual(render_string(source, who="bob"), "[T|alice]")
+
+    def test_props_are_part_of_the_key(self):
+        source = (
+            '{% palette_ui file="cache/card.html" component="card" cache=60 with title=title %}'
+            '{% endpalette_ui %}'
+        )
+        self.assertEqual(render_string(source, title="a", who="x"), "[a|x]")
+        self.assertEqual(render_string(source, title="b", who="x"), "[b|x]")
+
+    def test_tags_without_cache_follow_the_context(self):
+        source = (
+            '{% palette_ui file="cache/card.html" component="card" with title="T" %}'
+            '{% endpalette_ui %}'
+        )
+        self.assertEqual(render_string(source, who="alice"), "[T|alice]")
+        self.assertEqual(render_string(source, who="bob"), "[T|bob]")
+
+    def test_overrides_are_never_cached(self):
+        source = (
+            '{% palette_ui file="cache/card.html" component="card" cache=60 with title="T" %}'
+            '{% palette_override body %}{{ who }}{% endpalette_override %}'
+            '{% endpalette_ui %}'
+        )
+        self.assertEqual(render_string(source, who="alice"), "[alice|alice]")
+        self.assertEqual(render_string(source, who="bob"), "[bob|bob]")
+
+    def test_cache_takes_seconds(self):
+        with self.assertRaises(TemplateSyntaxError):
+            render_string(
+                '{% palette_ui file="cache/card.html" component="card" cache="soon" %}'
+                '{% endpalette_ui %}'
+            )